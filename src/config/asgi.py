@@ -10,7 +10,12 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# Import the URLconf and build the reverse lookup tables while the worker
+# boots, instead of on the first request it serves
+get_resolver().reverse_dict
@@ -15,6 +15,7 @@ from pathlib import Path
 
 import environ
 import sentry_sdk
+from django.core.exceptions import ImproperlyConfigured
 from sentry_sdk.integrations.django import DjangoIntegration
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -123,6 +124,28 @@ DATABASES = {
     ),
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Cached lists and reports are invalidated by bumping a version key, which
+# only reaches every worker process through a shared backend
+if DEBUG:
+    CACHES = {
+        "default": env.cache("CACHE_URL", default="locmemcache://"),
+    }
+else:
+    CACHES = {
+        "default": env.cache("CACHE_URL"),
+    }
+    if CACHES["default"]["BACKEND"] in (
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    ):
+        raise ImproperlyConfigured(
+            "CACHE_URL must point to a shared cache (Redis or memcached) "
+            "when DEBUG is off."
+        )
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,10 +1,17 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 from geo.models import City
 from users.models import Driver, Trader, UserAccount, UserRole
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache."""
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """Create and return an API client instance."""
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -8,6 +9,9 @@ from .services import send_notification_to_firebase
 @receiver(post_save, sender=Notification)
 def send_notification_for_user(sender, instance, created, **kwargs):
     if created:
-        send_notification_to_firebase(
-            [instance.id],
+        # Push once the notification is committed, so the caller's transaction
+        # (and its row locks) isn't held open for the Firebase round-trip.
+        # robust: a Firebase failure is logged, it can't fail a saved request
+        transaction.on_commit(
+            lambda: send_notification_to_firebase([instance.id]), robust=True
         )
@@ -1,8 +1,12 @@
 import pytest
+from django.urls import reverse
+from rest_framework import status
 from rest_framework.test import APIClient
 
+from notifications import services
 from notifications.models import Notification
-from users.models import UserAccount
+from transactions.models import TransactionType
+from users.models import FirebaseDevice, UserAccount
 
 
 @pytest.fixture
@@ -57,3 +61,45 @@ def test_driver_can_get_notifications_list(authenticated_driver_client, admin_us
     assert response.status_code == 200
     assert response.data["count"] == 2
     assert response.data["unread_count"] == 1
+
+
+def test_firebase_push_waits_for_commit(
+    driver_user, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks() as callbacks:
+        Notification.objects.create(
+            title="N1", description="D1", user_account=driver_user
+        )
+
+    assert len(callbacks) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_firebase_failure_does_not_fail_saved_request(
+    admin_client, driver, monkeypatch
+):
+    FirebaseDevice.objects.create(user=driver, token="token-1")
+    FirebaseDevice.objects.create(user=driver, token="token-2")
+    committed_on_push = []
+
+    def failing_send_each_for_multicast(message):
+        committed_on_push.append(
+            Notification.objects.filter(user_account=driver).exists()
+        )
+        raise ConnectionError("firebase is unreachable")
+
+    monkeypatch.setattr(
+        services.messaging, "send_each_for_multicast", failing_send_each_for_multicast
+    )
+
+    response = admin_client.post(
+        reverse("user-transactions-list"),
+        {
+            "user_account": driver.id,
+            "amount": "20.00",
+            "transaction_type": TransactionType.DEPOSIT,
+        },
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert committed_on_push == [True]
@@ -24,7 +24,10 @@ from orders.serializers import (
     ReferenceCodeSerializer,
 )
 from orders.services import DeliveryAssignmentService, OrderExportService
-from transactions.helpers import roll_back_order_transactions
+from transactions.helpers import (
+    invalidate_financial_insights,
+    roll_back_order_transactions,
+)
 from users.models import Driver, UserRole
 from utilities.api import BaseViewSet
 from utilities.exceptions import CustomValidationError
@@ -374,6 +377,8 @@ class OrderDriverAssignAPIView(APIView):
                 message="One or more orders cannot be assigned."
             )
         orders.update(driver=driver, status=OrderStatus.ASSIGNED)
+        # update() sends no post_save, so the insights cache is dropped here
+        transaction.on_commit(invalidate_financial_insights)
 
         data = []
         for tracking_number in serializer.validated_data["tracking_numbers"]:
@@ -495,6 +500,8 @@ class OrderAcceptAPIView(APIView):
         }
 
         orders.update(driver=driver, status=OrderStatus.ASSIGNED)
+        # update() sends no post_save, so the insights cache is dropped here
+        transaction.on_commit(invalidate_financial_insights)
 
         return Response(
             response_data,
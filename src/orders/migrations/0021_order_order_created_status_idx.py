@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:27
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently so order writes keep flowing
+    atomic = False
+
+    dependencies = [
+        ("geo", "0004_deliveryzone"),
+        ("orders", "0020_order_status_changed_at"),
+        ("users", "0017_alter_useraccount_phone_number"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                fields=["created", "status"], name="order_created_status_idx"
+            ),
+        ),
+    ]
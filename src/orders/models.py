@@ -109,6 +109,11 @@ class Order(AbstractBaseModel):
         related_name="orders",
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created", "status"], name="order_created_status_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.tracking_number:
             self.tracking_number = str(uuid.uuid4().int)[:12]
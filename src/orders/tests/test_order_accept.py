@@ -29,6 +29,23 @@ class TestOrderAcceptAPIView:
         assert created_order.status == OrderStatus.ASSIGNED
         assert created_order.driver == driver
 
+    def test_order_acceptance_refreshes_financial_insights(
+        self, driver_client, created_order, django_capture_on_commit_callbacks
+    ):
+        insights_url = reverse("financial-insights")
+        response = driver_client.get(insights_url)
+        assert response.data["orders"]["created__order_count"] == 1
+        assert response.data["orders"]["assigned_to_driver"] == 0
+
+        payload = {"reference_codes": [created_order.reference_code]}
+        with django_capture_on_commit_callbacks(execute=True):
+            response = driver_client.post(self.url, data=payload, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+        response = driver_client.get(insights_url)
+        assert response.data["orders"]["created__order_count"] == 0
+        assert response.data["orders"]["assigned_to_driver"] == 1
+
     def test_accept_multiple_orders(
         self, driver_client, created_order, trader, delivery_zone, driver
     ):
@@ -43,6 +43,29 @@ class TestOrderDriverAssignAPIView:
 
         assert Notification.objects.filter(user_account=driver).count() == 2
 
+    def test_assign_orders_refreshes_financial_insights(
+        self, admin_client, driver, created_order, django_capture_on_commit_callbacks
+    ):
+        insights_url = reverse("financial-insights")
+        response = admin_client.get(insights_url)
+        assert response.data["orders"]["created__order_count"] == 1
+        assert response.data["orders"]["assigned_to_driver"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.patch(
+                reverse("order-bulk-assign-driver"),
+                {
+                    "driver": driver.id,
+                    "tracking_numbers": [created_order.tracking_number],
+                },
+                format="json",
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = admin_client.get(insights_url)
+        assert response.data["orders"]["created__order_count"] == 0
+        assert response.data["orders"]["assigned_to_driver"] == 1
+
     def test_assign_orders_already_assigned(self, admin_client, driver, assigned_order):
         """Test that assigning an order that already has a driver fails."""
         url = reverse("order-bulk-assign-driver")
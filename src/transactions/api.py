@@ -1,7 +1,3 @@
-from datetime import date
-
-from django.db.models import Sum
-from django.db.models.functions import ExtractMonth, ExtractYear
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -13,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from transactions.filters import ExpenseFilter, UserAccountTransactionFilter
+from transactions.helpers import get_expense_statistics
 from transactions.models import Expense, UserAccountTransaction
 from transactions.serializers import (
     ExpenseSerializer,
@@ -22,6 +19,7 @@ from transactions.serializers import (
     UserAccountTransactionSerializer,
 )
 from utilities.api import BaseViewSet
+from utilities.custom_pagination_class import EstimatedCountPageNumberPagination
 
 
 class UserAccountTransactionViewSet(BaseViewSet):
@@ -31,6 +29,7 @@ class UserAccountTransactionViewSet(BaseViewSet):
     serializer_class = UserAccountTransactionSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = UserAccountTransactionFilter
+    pagination_class = EstimatedCountPageNumberPagination
     http_method_names = ["get", "post"]
     ordering = ["-id"]
 
@@ -41,17 +40,41 @@ class UserAccountTransactionViewSet(BaseViewSet):
             return UserAccountTransactionSerializer
         return super().get_serializer_class()
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # ListUserAccountTransactionSerializer nests the user account
+            queryset = queryset.select_related("user_account").only(
+                "id",
+                "amount",
+                "transaction_type",
+                "is_rolled_back",
+                "order_id",
+                "file",
+                "notes",
+                "created",
+                "modified",
+                "user_account__id",
+                "user_account__email",
+                "user_account__full_name",
+                "user_account__phone_number",
+                "user_account__role",
+                "user_account__is_active",
+                "user_account__created",
+                "user_account__modified",
+            )
+        return queryset
+
 
 class ExpenseViewSet(BaseViewSet):
     permission_classes = (IsAuthenticated,)
-    queryset = (
-        Expense.objects.order_by("-id")
-        .select_related("transaction__user_account")
-        .distinct()
+    queryset = Expense.objects.order_by("-id").select_related(
+        "transaction__user_account"
     )
     serializer_class = ExpenseSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = ExpenseFilter
+    pagination_class = EstimatedCountPageNumberPagination
     search_fields = ["description"]
 
     def get_serializer_class(self):
@@ -59,55 +82,40 @@ class ExpenseViewSet(BaseViewSet):
             return ListExpenseSerializer
         return super().get_serializer_class()
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # Only load the columns ListExpenseSerializer renders
+            queryset = queryset.only(
+                "id",
+                "date",
+                "cost",
+                "description",
+                "created",
+                "modified",
+                "transaction__id",
+                "transaction__amount",
+                "transaction__transaction_type",
+                "transaction__is_rolled_back",
+                "transaction__notes",
+                "transaction__created",
+                "transaction__modified",
+                "transaction__user_account__id",
+                "transaction__user_account__email",
+                "transaction__user_account__full_name",
+                "transaction__user_account__phone_number",
+                "transaction__user_account__role",
+                "transaction__user_account__is_active",
+                "transaction__user_account__created",
+                "transaction__user_account__modified",
+            )
+        return queryset
+
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         serializer = self.get_serializer(self.paginate_queryset(queryset), many=True)
 
-        yearly_data = (
-            Expense.objects.annotate(year=ExtractYear("date"))
-            .values("year")
-            .annotate(total=Sum("cost"))
-            .order_by("year")
-        )
-
-        monthly_data = (
-            Expense.objects.filter(date__year=date.today().year)
-            .annotate(month=ExtractMonth("date"))
-            .values("month")
-            .annotate(total=Sum("cost"))
-            .order_by("month")
-        )
-
-        converted_monthly = {
-            1: "يناير",
-            2: "فبراير",
-            3: "مارس",
-            4: "ابريل",
-            5: "مايو",
-            6: "يونيو",
-            7: "يوليو",
-            8: "اغسطس",
-            9: "سبتمبر",
-            10: "اكتوبر",
-            11: "نوفمبر",
-            12: "ديسمبر",
-        }
-
-        statistics_data = {
-            "total_expenses": Expense.objects.aggregate(total=Sum("cost"))["total"]
-            or 0.00,
-            "yearly": [
-                {"year": item["year"], "total": float(item["total"])}
-                for item in yearly_data[:6]
-            ],
-            "monthly": [
-                {
-                    "month": converted_monthly[item["month"]],
-                    "total": float(item["total"]),
-                }
-                for item in monthly_data
-            ],
-        }
+        statistics_data = get_expense_statistics()
 
         response_data = {"expenses": serializer.data, "statistics": statistics_data}
         return self.get_paginated_response(response_data)
@@ -1,5 +1,22 @@
+from contextlib import contextmanager
+from datetime import date
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Sum, Value
+from django.db.models.functions import Concat, ExtractMonth, ExtractYear
+from django.utils import timezone
+
 from orders.models import Order
-from transactions.models import TransactionType, UserAccountTransaction
+from transactions.models import Expense, TransactionType, UserAccountTransaction
+from utilities.cache import bump_cache_version, get_versioned_cache_key
+from utilities.constant import EXPENSE_CONVERTED_MONTHLY
+
+EXPENSE_STATISTICS_CACHE_KEY = "expense_statistics"
+EXPENSE_STATISTICS_CACHE_TIMEOUT = 60 * 5
+
+FINANCIAL_INSIGHTS_CACHE_VERSION_KEY = "financial_insights:version"
+FINANCIAL_INSIGHTS_CACHE_TIMEOUT = 60 * 5
 
 
 def create_transaction(user_id, amount, transaction_type, order_id, notes=""):
@@ -12,52 +29,79 @@ def create_transaction(user_id, amount, transaction_type, order_id, notes=""):
     )
 
 
-def roll_back_order_transactions(order_id):
-    transactions = UserAccountTransaction.objects.filter(
-        order_id=order_id, is_rolled_back=False
-    )
-    for transaction in transactions:
-        transaction.is_rolled_back = True
-        transaction.notes = transaction.notes + " (استرجاع)"
-        transaction.save()
-        if transaction.transaction_type == TransactionType.WITHDRAW:
-            UserAccountTransaction.objects.create(
-                user_account_id=transaction.user_account_id,
-                amount=transaction.amount,
-                transaction_type=TransactionType.DEPOSIT,
-                is_rolled_back=True,
-                notes="مبلغ مسترجع الخاص بالطلب رقم "
-                + transaction.order.tracking_number,
-                order_id=transaction.order_id,
-            )
-        elif transaction.transaction_type == TransactionType.DEPOSIT:
-            UserAccountTransaction.objects.create(
-                user_account_id=transaction.user_account_id,
-                amount=transaction.amount,
-                transaction_type=TransactionType.WITHDRAW,
-                is_rolled_back=True,
-                notes="مبلغ مسترجع الخاص بالطلب رقم "
-                + transaction.order.tracking_number,
-                order_id=transaction.order_id,
-            )
+def lock_order(order_id):
+    # Serializes the helpers below per order, so two concurrent callers cannot
+    # both pass the "no active transaction yet" check
+    Order.objects.select_for_update().filter(id=order_id).exists()
 
 
-def create_order_transaction(user_id, amount, transaction_type, order_id, notes=""):
-    already_exists = UserAccountTransaction.objects.filter(
-        order_id=order_id,
-        transaction_type=transaction_type,
-        user_account_id=user_id,
-        is_rolled_back=False,
-    ).exists()
-    if already_exists:
+@transaction.atomic
+def roll_back_order_transactions(order_id):
+    lock_order(order_id)
+    order_transactions = list(
+        UserAccountTransaction.objects.filter(
+            order_id=order_id, is_rolled_back=False
+        ).values(
+            "id",
+            "amount",
+            "transaction_type",
+            "user_account_id",
+            "user_account_role",
+            "order_id",
+            "order__tracking_number",
+        )
+    )
+    if not order_transactions:
         return
 
-    order = Order.objects.filter(id=order_id).first()
+    reversed_types = {
+        TransactionType.WITHDRAW: TransactionType.DEPOSIT,
+        TransactionType.DEPOSIT: TransactionType.WITHDRAW,
+    }
+    UserAccountTransaction.objects.filter(
+        id__in=[order_transaction["id"] for order_transaction in order_transactions]
+    ).update(
+        is_rolled_back=True,
+        notes=Concat("notes", Value(" (استرجاع)")),
+        modified=timezone.now(),
+    )
+    # Reversals go through create() so their post_save receivers apply the
+    # balance, send the notification and drop the cached reports; an order
+    # has only a few transactions to reverse
+    for order_transaction in order_transactions:
+        reversed_type = reversed_types.get(order_transaction["transaction_type"])
+        if reversed_type is None:
+            continue
+        UserAccountTransaction.objects.create(
+            user_account_id=order_transaction["user_account_id"],
+            user_account_role=order_transaction["user_account_role"],
+            amount=order_transaction["amount"],
+            transaction_type=reversed_type,
+            is_rolled_back=True,
+            notes="مبلغ مسترجع الخاص بالطلب رقم "
+            + order_transaction["order__tracking_number"],
+            order_id=order_transaction["order_id"],
+        )
 
-    if not order:
-        return
 
-    if order.postpone_count > 1:
+@transaction.atomic
+def create_order_transaction(user_id, amount, transaction_type, order_id, notes=""):
+    lock_order(order_id)
+    can_create = (
+        Order.objects.filter(id=order_id, postpone_count__lte=1)
+        .exclude(
+            Exists(
+                UserAccountTransaction.objects.filter(
+                    order_id=OuterRef("pk"),
+                    transaction_type=transaction_type,
+                    user_account_id=user_id,
+                    is_rolled_back=False,
+                )
+            )
+        )
+        .exists()
+    )
+    if not can_create:
         return
 
     create_transaction(
@@ -67,3 +111,76 @@ def create_order_transaction(user_id, amount, transaction_type, order_id, notes=
         order_id=order_id,
         notes=notes,
     )
+
+
+def compute_expense_statistics():
+    yearly_data = (
+        Expense.objects.annotate(year=ExtractYear("date"))
+        .values("year")
+        .annotate(total=Sum("cost"))
+        .order_by("year")
+    )
+
+    monthly_data = (
+        Expense.objects.filter(date__year=date.today().year)
+        .annotate(month=ExtractMonth("date"))
+        .values("month")
+        .annotate(total=Sum("cost"))
+        .order_by("month")
+    )
+
+    return {
+        "total_expenses": Expense.objects.aggregate(total=Sum("cost"))["total"] or 0.00,
+        "yearly": [
+            {"year": item["year"], "total": float(item["total"])}
+            for item in yearly_data[:6]
+        ],
+        "monthly": [
+            {
+                "month": EXPENSE_CONVERTED_MONTHLY[item["month"]],
+                "total": float(item["total"]),
+            }
+            for item in monthly_data
+        ],
+    }
+
+
+def get_expense_statistics():
+    # Expense statistics are not filtered per request; they are cached and
+    # invalidated whenever an expense is saved or deleted
+    return cache.get_or_set(
+        EXPENSE_STATISTICS_CACHE_KEY,
+        compute_expense_statistics,
+        EXPENSE_STATISTICS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_expense_statistics():
+    cache.delete(EXPENSE_STATISTICS_CACHE_KEY)
+
+
+def get_financial_insights_cache_key(*dates):
+    return get_versioned_cache_key(
+        FINANCIAL_INSIGHTS_CACHE_VERSION_KEY,
+        "financial_insights",
+        ":".join(value.isoformat() for value in dates),
+    )
+
+
+def invalidate_financial_insights():
+    bump_cache_version(FINANCIAL_INSIGHTS_CACHE_VERSION_KEY)
+
+
+@contextmanager
+def snapshot_read():
+    """Run the enclosed queries against a single snapshot of the database."""
+    # Only the outermost transaction can choose its isolation level; nested
+    # in one (atomic views, tests) the queries already share its connection
+    outermost = not connection.in_atomic_block
+    with transaction.atomic():
+        if outermost and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"
+                )
+        yield
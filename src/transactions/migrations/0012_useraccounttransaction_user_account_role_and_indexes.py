@@ -0,0 +1,84 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:41
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_user_account_role(apps, schema_editor):
+    # The migration is not atomic, so each batch commits on its own and only
+    # holds row locks on its own id range
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT MIN(id), MAX(id) FROM transactions_useraccounttransaction"
+        )
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return
+        for start in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+            cursor.execute(
+                """
+                UPDATE transactions_useraccounttransaction AS uat
+                SET user_account_role = ua.role
+                FROM users_useraccount AS ua
+                WHERE ua.id = uat.user_account_id
+                    AND uat.id >= %s AND uat.id < %s
+                """,
+                [start, start + BACKFILL_BATCH_SIZE],
+            )
+
+
+class Migration(migrations.Migration):
+    # Indexes on transactions are built concurrently so writes keep flowing
+    atomic = False
+
+    dependencies = [
+        ("orders", "0021_order_order_created_status_idx"),
+        ("transactions", "0011_expense_transaction"),
+        ("users", "0017_alter_useraccount_phone_number"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="useraccounttransaction",
+            name="user_account_role",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("owner", "owner"),
+                    ("manager", "manager"),
+                    ("admin", "admin"),
+                    ("trader", "trader"),
+                    ("driver", "driver"),
+                ],
+                editable=False,
+                max_length=10,
+            ),
+        ),
+        migrations.RunPython(backfill_user_account_role, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="expense",
+            index=models.Index(fields=["date"], name="expense_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="useraccounttransaction",
+            index=models.Index(
+                condition=models.Q(("is_rolled_back", False), ("order__isnull", False)),
+                fields=["created", "transaction_type", "user_account_role"],
+                include=("amount",),
+                name="uat_financial_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="useraccounttransaction",
+            index=models.Index(
+                condition=models.Q(("is_rolled_back", False), ("order__isnull", False)),
+                fields=["user_account", "transaction_type"],
+                include=("amount",),
+                name="uat_account_sales_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-16 22:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes on transactions are built concurrently so writes keep flowing
+    atomic = False
+
+    dependencies = [
+        ("transactions", "0012_useraccounttransaction_user_account_role_and_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="useraccounttransaction",
+            index=models.Index(
+                condition=models.Q(("is_rolled_back", False)),
+                fields=["order"],
+                name="tx_order_active_idx",
+            ),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 
 from orders.models import Order
-from users.models import UserAccount
+from users.models import UserAccount, UserRole
 from utilities.models.abstract_base_model import AbstractBaseModel
 
 
@@ -29,6 +29,39 @@ class UserAccountTransaction(AbstractBaseModel):
         related_name="transactions",
         null=True,
     )
+    # copied from user_account on insert so the financial reports can filter
+    # by role without joining users_useraccount
+    user_account_role = models.CharField(
+        max_length=10, choices=UserRole.choices, blank=True, editable=False
+    )
+
+    class Meta:
+        indexes = [
+            # active transactions of an order, probed before creating or
+            # rolling back order transactions
+            models.Index(
+                fields=["order"],
+                condition=models.Q(is_rolled_back=False),
+                name="tx_order_active_idx",
+            ),
+            models.Index(
+                fields=["created", "transaction_type", "user_account_role"],
+                include=["amount"],
+                condition=models.Q(is_rolled_back=False, order__isnull=False),
+                name="uat_financial_idx",
+            ),
+            models.Index(
+                fields=["user_account", "transaction_type"],
+                include=["amount"],
+                condition=models.Q(is_rolled_back=False, order__isnull=False),
+                name="uat_account_sales_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.user_account_id and not self.user_account_role:
+            self.user_account_role = self.user_account.role
+        super().save(*args, **kwargs)
 
 
 class Expense(AbstractBaseModel):
@@ -41,3 +74,8 @@ class Expense(AbstractBaseModel):
         related_name="expenses",
         null=True,
     )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["date"], name="expense_date_idx"),
+        ]
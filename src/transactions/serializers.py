@@ -1,17 +1,29 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
-from django.db.models import Count, Sum
-from django.db.models.functions import TruncMonth
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
 from orders.models import Order, OrderStatus
+from transactions.helpers import (
+    FINANCIAL_INSIGHTS_CACHE_TIMEOUT,
+    get_financial_insights_cache_key,
+    snapshot_read,
+)
 from transactions.models import Expense, TransactionType, UserAccountTransaction
 from users.models import UserRole
 from users.serializers.user_account_serializers import SingleUserAccountSerializer
+from utilities.constant import CONVERTED_MONTHLY
 from utilities.exceptions import CustomValidationError
 
 
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
 class UserAccountTransactionSerializer(ModelSerializer):
     class Meta:
         model = UserAccountTransaction
@@ -29,16 +41,9 @@ class UserAccountTransactionSerializer(ModelSerializer):
         ]
         read_only_fields = ("id", "created", "modified")
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        request = self.context.get("request")
-        if instance.file and request:
-            representation["file"] = request.build_absolute_uri(instance.file.url)
-        return representation
-
 
 class ListUserAccountTransactionSerializer(ModelSerializer):
-    user_account = SingleUserAccountSerializer()
+    user_account = SingleUserAccountSerializer(read_only=True)
 
     class Meta:
         model = UserAccountTransaction
@@ -54,10 +59,11 @@ class ListUserAccountTransactionSerializer(ModelSerializer):
             "created",
             "modified",
         ]
+        read_only_fields = fields
 
 
 class SingleUserAccountTransactionSerializer(ModelSerializer):
-    user_account = SingleUserAccountSerializer()
+    user_account = SingleUserAccountSerializer(read_only=True)
 
     class Meta:
         model = UserAccountTransaction
@@ -71,6 +77,7 @@ class SingleUserAccountTransactionSerializer(ModelSerializer):
             "created",
             "modified",
         ]
+        read_only_fields = fields
 
 
 class ExpenseSerializer(ModelSerializer):
@@ -88,7 +95,7 @@ class ExpenseSerializer(ModelSerializer):
 
 
 class ListExpenseSerializer(ModelSerializer):
-    transaction = SingleUserAccountTransactionSerializer()
+    transaction = SingleUserAccountTransactionSerializer(read_only=True)
 
     class Meta:
         model = Expense
@@ -101,6 +108,7 @@ class ListExpenseSerializer(ModelSerializer):
             "created",
             "modified",
         ]
+        read_only_fields = fields
 
 
 class FinancialInsightsSerializer(serializers.Serializer):
@@ -118,24 +126,6 @@ class FinancialInsightsSerializer(serializers.Serializer):
     shipment_end_date = serializers.DateField(
         format="%Y-%m-%d", input_formats=["%Y-%m-%d"], required=False
     )
-    total_revenue = serializers.DecimalField(
-        max_digits=12, decimal_places=2, read_only=True
-    )
-    total_expenses = serializers.DecimalField(
-        max_digits=12, decimal_places=2, read_only=True
-    )
-    net_profit = serializers.DecimalField(
-        max_digits=12, decimal_places=2, read_only=True
-    )
-    shipments_completed = serializers.IntegerField(read_only=True)
-    pending_receivables = serializers.DecimalField(
-        max_digits=12, decimal_places=2, read_only=True
-    )
-    pending_payables = serializers.DecimalField(
-        max_digits=12, decimal_places=2, read_only=True
-    )
-    balance = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
-    monthly_expenses_data = serializers.DictField(read_only=True)
 
     def validate(self, data):
         start = data.get("start_date")
@@ -144,99 +134,74 @@ class FinancialInsightsSerializer(serializers.Serializer):
             raise CustomValidationError("start_date cannot be after end_date.")
         return data
 
-    def _get_multiline_chart_data(self, converted_monthly):
+    def _get_month_totals(self, months, month):
+        if months[month] is None:
+            months[month] = {
+                "name": CONVERTED_MONTHLY[month],
+                "total_income": 0.0,
+                "total_commissions": 0.0,
+                "total_delivery_expense": 0.0,
+            }
+        return months[month]
+
+    def _get_multiline_chart_data(self, chart_start_date):
         # for multiline chart
-        chart_start_date = datetime.now().date().replace(month=1, day=1)
-        monthly_expenses_data = []
-        revenues = (
-            UserAccountTransaction.objects.filter(
-                transaction_type=TransactionType.WITHDRAW,
-                is_rolled_back=False,
-                user_account__role=UserRole.TRADER,
-                order_id__isnull=False,
-                created__date__gte=chart_start_date,
-            )
-            .annotate(month=TruncMonth("created"))
-            .values("month")
-            .annotate(IDs_count=Sum("amount"))
-            .order_by("month")
+        chart_end_date = chart_start_date.replace(year=chart_start_date.year + 1)
+        # indexed by month number, slot 0 is unused, so the range must stay
+        # within one year for months not to collide
+        months = [None] * 13
+        revenue_filter = Q(
+            transaction_type=TransactionType.WITHDRAW,
+            user_account_role=UserRole.TRADER,
         )
-
-        for item in revenues:
-            monthly_expenses_data.append(
-                {
-                    "name": converted_monthly[item["month"].month],
-                    "total_income": item["IDs_count"],
-                }
-            )
-
-        commissions = (
+        commissions_filter = Q(
+            transaction_type=TransactionType.DEPOSIT,
+            user_account_role=UserRole.DRIVER,
+        )
+        transactions = (
             UserAccountTransaction.objects.filter(
-                transaction_type=TransactionType.DEPOSIT,
+                revenue_filter | commissions_filter,
                 is_rolled_back=False,
-                user_account__role=UserRole.DRIVER,
                 order_id__isnull=False,
-                created__date__gte=chart_start_date,
+                created__gte=start_of_day(chart_start_date),
+                created__lt=start_of_day(chart_end_date),
             )
-            .annotate(month=TruncMonth("created"))
+            .annotate(month=ExtractMonth("created"))
             .values("month")
-            .annotate(total_commissions=Sum("amount"))
+            .annotate(
+                total_income=Sum("amount", filter=revenue_filter),
+                total_commissions=Sum("amount", filter=commissions_filter),
+            )
+            .values_list("month", "total_income", "total_commissions")
             .order_by("month")
         )
 
-        for item in commissions:
-            monthly_expenses_data.append(
-                {
-                    "name": converted_monthly[item["month"].month],
-                    "total_commissions": item["total_commissions"],
-                }
-            )
+        for month, total_income, total_commissions in transactions:
+            month_data = self._get_month_totals(months, month)
+            month_data["total_income"] += float(total_income or 0)
+            month_data["total_commissions"] += float(total_commissions or 0)
 
         expenses = (
             Expense.objects.filter(
                 date__gte=chart_start_date,
+                date__lt=chart_end_date,
             )
-            .annotate(month=TruncMonth("date"))
+            .annotate(month=ExtractMonth("date"))
             .values("month")
             .annotate(total_expense=Sum("cost"))
+            .values_list("month", "total_expense")
             .order_by("month")
         )
 
-        for item in expenses:
-            monthly_expenses_data.append(
-                {
-                    "name": converted_monthly[item["month"].month],
-                    "total_delivery_expense": item["total_expense"],
-                }
-            )
-
-        merged = {}
-
-        for item in monthly_expenses_data:
-            month = item["name"]
-
-            if month not in merged:
-                merged[month] = {
-                    "name": month,
-                    "total_income": 0.0,
-                    "total_commissions": 0.0,
-                    "total_delivery_expense": 0.0,
-                }
-
-            if "total_income" in item:
-                merged[month]["total_income"] += float(item["total_income"])
-
-            if "total_commissions" in item:
-                merged[month]["total_commissions"] += float(item["total_commissions"])
-
-            if "total_delivery_expense" in item:
-                merged[month]["total_delivery_expense"] += float(
-                    item["total_delivery_expense"]
-                )
+        for month, total_expense in expenses:
+            month_data = self._get_month_totals(months, month)
+            month_data["total_delivery_expense"] += float(total_expense)
 
         result = []
 
-        for month_data in merged.values():
+        for month_data in months:
+            if month_data is None:
+                continue
             month_data["net_profit"] = (
                 month_data["total_income"]
                 - month_data["total_commissions"]
@@ -246,36 +211,33 @@ class FinancialInsightsSerializer(serializers.Serializer):
 
         return result
 
-    def get_shipment_chart_data(self, start_date, end_date, converted_monthly):
-        shipment_count_chart = (
+    def get_orders_data(self, start_date, end_date):
+        # orders statistics and shipments chart share one scan over the range
+        orders_qs = (
             Order.objects.filter(
-                created__range=(start_date, end_date),
-                status__in=[OrderStatus.DELIVERED],
-            )
-            .annotate(month=TruncMonth("created"))
-            .values("month")
-            .annotate(IDs_count=Count("id", distinct=True))
-            .order_by("month")
-        )
-
-        shipments_per_month = []
-        for item in shipment_count_chart:
-            shipments_per_month.append(
-                {
-                    "month": converted_monthly[item["month"].month],
-                    "shipment_count": item["IDs_count"],
-                }
+                created__gte=start_of_day(start_date),
+                created__lt=start_of_day(end_date),
             )
-
-        return shipments_per_month
-
-    def get_orders_statistics(self, start_date, end_date):
-        orders_statistics_qs = (
-            Order.objects.filter(
-                created__range=(start_date, end_date),
+            .annotate(year=ExtractYear("created"), month=ExtractMonth("created"))
+            .values("year", "month")
+            .annotate(
+                delivered_order_count=Count(
+                    "id", filter=Q(status=OrderStatus.DELIVERED)
+                ),
+                cancelled_order_count=Count(
+                    "id", filter=Q(status=OrderStatus.CANCELLED)
+                ),
+                created__order_count=Count("id", filter=Q(status=OrderStatus.CREATED)),
+                assigned_to_driver=Count("id", filter=Q(status=OrderStatus.ASSIGNED)),
+                in_progress_order_count=Count(
+                    "id", filter=Q(status=OrderStatus.IN_PROGRESS)
+                ),
+                postponed_order_count=Count(
+                    "id", filter=Q(status=OrderStatus.POSTPONED)
+                ),
+                total_count=Count("id"),
             )
-            .values("status")
-            .annotate(count=Count("id"))
+            .order_by("year", "month")
         )
         orders_statistics = {
             "delivered_order_count": 0,
@@ -284,33 +246,29 @@ class FinancialInsightsSerializer(serializers.Serializer):
             "assigned_to_driver": 0,
             "in_progress_order_count": 0,
             "postponed_order_count": 0,
+            "total_count": 0,
         }
 
-        status_map = {
-            OrderStatus.DELIVERED: "delivered_order_count",
-            OrderStatus.CANCELLED: "cancelled_order_count",
-            OrderStatus.CREATED: "created__order_count",
-            OrderStatus.ASSIGNED: "assigned_to_driver",
-            OrderStatus.IN_PROGRESS: "in_progress_order_count",
-            OrderStatus.POSTPONED: "postponed_order_count",
-        }
-
-        total_count = 0
-        for item in orders_statistics_qs:
-            status = item["status"]
-            count = item["count"]
-            total_count += count
-            if status in status_map:
-                orders_statistics[status_map[status]] = count
-        orders_statistics["total_count"] = total_count
+        shipments_per_month = []
+        for item in orders_qs:
+            for key in orders_statistics:
+                orders_statistics[key] += item[key]
+            if item["delivered_order_count"]:
+                shipments_per_month.append(
+                    {
+                        "month": CONVERTED_MONTHLY[item["month"]],
+                        "shipment_count": item["delivered_order_count"],
+                    }
+                )
 
-        return orders_statistics
+        return orders_statistics, shipments_per_month
 
     def to_representation(self, instance):
         today = date.today()
-        current_year_start_date = datetime.now().date().replace(month=1, day=1)
+        current_year_start_date = today.replace(month=1, day=1)
 
         summary_start_date = instance.get("start_date", today.replace(day=1))
+        # end dates are inclusive, the queries filter on [start, end + 1 day)
         summary_end_date = instance.get("end_date", today)
         summary_end_date = summary_end_date + timedelta(days=1)
 
@@ -320,61 +278,77 @@ class FinancialInsightsSerializer(serializers.Serializer):
         shipment_end_date = instance.get("shipment_end_date", today)
         shipment_end_date = shipment_end_date + timedelta(days=1)
 
-        converted_monthly = {
-            1: "يناير",
-            2: "فبراير",
-            3: "مارس",
-            4: "أبريل",
-            5: "مايو",
-            6: "يونيو",
-            7: "يوليو",
-            8: "أغسطس",
-            9: "سبتمبر",
-            10: "أكتوبر",
-            11: "نوفمبر",
-            12: "ديسمبر",
-        }
-
-        # first line
-        total_revenue = (
-            UserAccountTransaction.objects.filter(
-                created__range=(summary_start_date, summary_end_date),
-                transaction_type=TransactionType.WITHDRAW,
-                is_rolled_back=False,
-                user_account__role=UserRole.TRADER,
-                order_id__isnull=False,
-            ).aggregate(total_revenue=Sum("amount"))["total_revenue"]
-            or 0
+        cache_key = get_financial_insights_cache_key(
+            summary_start_date,
+            summary_end_date,
+            shipment_start_date,
+            shipment_end_date,
+            current_year_start_date,
+        )
+        return cache.get_or_set(
+            cache_key,
+            lambda: self.get_financial_insights(
+                summary_start_date,
+                summary_end_date,
+                shipment_start_date,
+                shipment_end_date,
+                current_year_start_date,
+            ),
+            FINANCIAL_INSIGHTS_CACHE_TIMEOUT,
         )
 
-        total_commissions = (
-            UserAccountTransaction.objects.filter(
-                created__range=(summary_start_date, summary_end_date),
-                transaction_type=TransactionType.DEPOSIT,
-                is_rolled_back=False,
-                user_account__role=UserRole.DRIVER,
-                order_id__isnull=False,
-            ).aggregate(total_commissions=Sum("amount"))["total_commissions"]
-            or 0
+    def get_summary_totals(self, start_date, end_date):
+        totals = UserAccountTransaction.objects.filter(
+            created__gte=start_of_day(start_date),
+            created__lt=start_of_day(end_date),
+            is_rolled_back=False,
+            order_id__isnull=False,
+        ).aggregate(
+            total_revenue=Sum(
+                "amount",
+                filter=Q(
+                    transaction_type=TransactionType.WITHDRAW,
+                    user_account_role=UserRole.TRADER,
+                ),
+            ),
+            total_commissions=Sum(
+                "amount",
+                filter=Q(
+                    transaction_type=TransactionType.DEPOSIT,
+                    user_account_role=UserRole.DRIVER,
+                ),
+            ),
         )
+        total_revenue = totals["total_revenue"] or 0
+        total_commissions = totals["total_commissions"] or 0
         summary_expense = (
-            Expense.objects.filter(
-                date__range=(summary_start_date, summary_end_date)
-            ).aggregate(total_expense=Sum("cost"))
+            Expense.objects.filter(date__gte=start_date, date__lt=end_date).aggregate(
+                total_expense=Sum("cost")
+            )
         )["total_expense"] or 0
 
-        # second line
-        orders_statistics = self.get_orders_statistics(
-            shipment_start_date, shipment_end_date
-        )
-
-        # for multiline chart
-        monthly_expenses_data = self._get_multiline_chart_data(converted_monthly)
-
-        # for shipments chart
-        shipments_per_month = self.get_shipment_chart_data(
-            shipment_start_date, shipment_end_date, converted_monthly
-        )
+        return total_revenue, total_commissions, summary_expense
+
+    def get_financial_insights(
+        self,
+        summary_start_date,
+        summary_end_date,
+        shipment_start_date,
+        shipment_end_date,
+        chart_start_date,
+    ):
+        # All three groups read one snapshot so the totals agree with each other
+        with snapshot_read():
+            # first line
+            total_revenue, total_commissions, summary_expense = self.get_summary_totals(
+                summary_start_date, summary_end_date
+            )
+            # second line and shipments chart
+            orders_statistics, shipments_per_month = self.get_orders_data(
+                shipment_start_date, shipment_end_date
+            )
+            # for multiline chart
+            monthly_expenses_data = self._get_multiline_chart_data(chart_start_date)
 
         return {
             "date": {
@@ -1,19 +1,31 @@
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Concat
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from notifications.service import send_notification
+from orders.models import Order
+from transactions.helpers import (
+    invalidate_expense_statistics,
+    invalidate_financial_insights,
+)
 from transactions.models import Expense, TransactionType, UserAccountTransaction
 
+BALANCE_SIGNS = {
+    TransactionType.WITHDRAW: 1,
+    TransactionType.DEPOSIT: -1,
+    TransactionType.EXPENSE: -1,
+}
+
 
 @receiver(post_save, sender=UserAccountTransaction)
 def update_user_account_balance_for_transaction(sender, instance, created, **kwargs):
-    if created:
-        if instance.transaction_type == TransactionType.WITHDRAW:
-            instance.user_account.update_balance(instance.amount)
-        elif instance.transaction_type == TransactionType.DEPOSIT:
-            instance.user_account.update_balance(-instance.amount)
-        elif instance.transaction_type == TransactionType.EXPENSE:
-            instance.user_account.update_balance(-instance.amount)
+    if created and instance.transaction_type in BALANCE_SIGNS:
+        instance.user_account.update_balance(
+            BALANCE_SIGNS[instance.transaction_type] * instance.amount
+        )
 
 
 @receiver(post_save, sender=UserAccountTransaction)
@@ -45,17 +57,47 @@ def send_notification_after_transaction(sender, instance, created, **kwargs):
 
 @receiver(post_delete, sender=Expense)
 def roll_back_expense(sender, instance, **kwargs):
-    transactions = UserAccountTransaction.objects.filter(
-        id=instance.transaction_id, is_rolled_back=False
-    )
-    for transaction in transactions:
-        transaction.is_rolled_back = True
-        transaction.notes = transaction.notes + " (استرجاع)"
-        transaction.save()
+    if not instance.transaction_id:
+        return
+
+    with transaction.atomic():
+        expense_transaction = (
+            UserAccountTransaction.objects.select_for_update()
+            .filter(id=instance.transaction_id, is_rolled_back=False)
+            .values("user_account_id", "amount")
+            .first()
+        )
+        if expense_transaction is None:
+            return
+
+        UserAccountTransaction.objects.filter(id=instance.transaction_id).update(
+            is_rolled_back=True,
+            notes=Concat("notes", Value(" (استرجاع)")),
+            modified=timezone.now(),
+        )
+        # The balance is applied by the post_save receiver with an F() update
         UserAccountTransaction.objects.create(
-            user_account_id=transaction.user_account_id,
-            amount=transaction.amount,
+            user_account_id=expense_transaction["user_account_id"],
+            amount=expense_transaction["amount"],
             transaction_type=TransactionType.WITHDRAW,
             is_rolled_back=True,
             notes="مبلغ مسترجع الخاص المصارف",
         )
+
+
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+def invalidate_expense_statistics_cache(sender, instance, **kwargs):
+    # Invalidating before commit would let a concurrent read refill the cache
+    # from the data this write is replacing
+    transaction.on_commit(invalidate_expense_statistics)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+@receiver(post_save, sender=UserAccountTransaction)
+@receiver(post_delete, sender=UserAccountTransaction)
+def invalidate_financial_insights_cache(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_financial_insights)
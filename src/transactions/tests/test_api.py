@@ -1,15 +1,22 @@
+from decimal import Decimal
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 
+from orders.models import Order
 from transactions.models import TransactionType, UserAccountTransaction
+from users.models import UserAccount, UserRole
 
 
 @pytest.mark.django_db
 class TestUserAccountTransactionViewSet:
+    def setup_method(self):
+        self.url = reverse("user-transactions-list")
+
     def test_list_transactions(self, admin_client, transaction):
-        url = reverse("user-transactions-list")
-        response = admin_client.get(url)
+        response = admin_client.get(self.url)
 
         assert response.status_code == status.HTTP_200_OK
         # The response is paginated, so we check 'results'
@@ -17,42 +24,99 @@ class TestUserAccountTransactionViewSet:
         assert response.data["results"][0]["id"] == transaction.id
 
     def test_create_transaction(self, admin_client, admin_user):
-        url = reverse("user-transactions-list")
-        data = {
-            "user_account": admin_user.id,
-            "amount": "50.00",
-            "transaction_type": TransactionType.WITHDRAW,
-            "notes": "New withdrawal",
+        payloads = [
+            ("50.00", TransactionType.WITHDRAW, "New withdrawal"),
+            ("100.00", TransactionType.DEPOSIT, "New deposit"),
+            ("130.00", TransactionType.EXPENSE, "New expense"),
+        ]
+        for amount, transaction_type, notes in payloads:
+            data = {
+                "user_account": admin_user.id,
+                "amount": amount,
+                "transaction_type": transaction_type,
+                "notes": notes,
+            }
+            response = admin_client.post(self.url, data)
+            assert response.status_code == status.HTTP_201_CREATED
+
+        created = set(
+            UserAccountTransaction.objects.filter(user_account=admin_user).values_list(
+                "amount", "transaction_type"
+            )
+        )
+        assert created == {
+            (Decimal(amount), transaction_type)
+            for amount, transaction_type, _ in payloads
         }
-        response = admin_client.post(url, data)
-        assert response.status_code == status.HTTP_201_CREATED
-        assert UserAccountTransaction.objects.filter(amount=50.00).exists()
 
+    def test_create_transaction_copies_user_account_role(self, admin_client, driver):
         data = {
-            "user_account": admin_user.id,
-            "amount": "100.00",
+            "user_account": driver.id,
+            "amount": "20.00",
             "transaction_type": TransactionType.DEPOSIT,
-            "notes": "New deposit",
         }
-        response = admin_client.post(url, data)
+        response = admin_client.post(self.url, data)
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert UserAccountTransaction.objects.filter(amount=100.00).exists()
+        transaction = UserAccountTransaction.objects.get(id=response.data["id"])
+        assert transaction.user_account_role == UserRole.DRIVER
+
+    def test_create_duplicate_order_transaction(self, admin_client, trader):
+        order = Order.objects.create(reference_code="REF-MANUAL", trader=trader)
+        data = {
+            "user_account": trader.id,
+            "amount": "40.00",
+            "transaction_type": TransactionType.WITHDRAW,
+            "order": order.id,
+        }
+        for _ in range(2):
+            response = admin_client.post(self.url, data)
+            assert response.status_code == status.HTTP_201_CREATED
+
+        assert (
+            UserAccountTransaction.objects.filter(
+                order=order, is_rolled_back=False
+            ).count()
+            == 2
+        )
 
+    def test_create_transaction_returns_absolute_file_url(
+        self, admin_client, admin_user
+    ):
         data = {
             "user_account": admin_user.id,
-            "amount": "130.00",
-            "transaction_type": TransactionType.EXPENSE,
-            "notes": "New expense",
+            "amount": "75.00",
+            "transaction_type": TransactionType.DEPOSIT,
+            "file": SimpleUploadedFile(
+                "receipt.txt", b"receipt", content_type="text/plain"
+            ),
         }
-        response = admin_client.post(url, data)
+        response = admin_client.post(self.url, data, format="multipart")
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert UserAccountTransaction.objects.filter(amount=130.00).exists()
+        assert response.data["file"].startswith("http://testserver/media/")
+
+    def test_concurrent_transactions_keep_both_balance_changes(self, driver):
+        # Both accounts load the driver row before either transaction is saved
+        first = UserAccount.objects.select_related("driver").get(pk=driver.pk)
+        second = UserAccount.objects.select_related("driver").get(pk=driver.pk)
+
+        UserAccountTransaction.objects.create(
+            user_account=first,
+            amount=Decimal("100.00"),
+            transaction_type=TransactionType.WITHDRAW,
+        )
+        UserAccountTransaction.objects.create(
+            user_account=second,
+            amount=Decimal("30.00"),
+            transaction_type=TransactionType.DEPOSIT,
+        )
+
+        driver.refresh_from_db()
+        assert driver.balance == Decimal("70.00")
 
     def test_filter_transactions_by_user(self, admin_client, transaction, admin_user):
-        url = reverse("user-transactions-list")
-        response = admin_client.get(url, {"user_account": admin_user.id})
+        response = admin_client.get(self.url, {"user_account": admin_user.id})
 
         assert response.status_code == status.HTTP_200_OK
         assert all(
@@ -61,24 +125,22 @@ class TestUserAccountTransactionViewSet:
         )
 
     def test_filter_transactions_by_type(self, admin_client, transaction):
-        url = reverse("user-transactions-list")
-        # Filter for DEPOSIT
-        response = admin_client.get(url, {"transaction_type": TransactionType.DEPOSIT})
-        assert response.status_code == status.HTTP_200_OK
-        assert any(
-            item["transaction_type"] == TransactionType.DEPOSIT
-            for item in response.data["results"]
+        # The count is computed by the filtered query, so one row per page is enough
+        response = admin_client.get(
+            self.url, {"transaction_type": TransactionType.DEPOSIT, "page_size": 1}
         )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["id"] == transaction.id
 
         # Filter for WITHDRAW (should be empty if only the fixture exists)
-        response = admin_client.get(url, {"transaction_type": TransactionType.WITHDRAW})
-        assert response.status_code == status.HTTP_200_OK
-        assert all(
-            item["transaction_type"] != TransactionType.DEPOSIT
-            for item in response.data["results"]
+        response = admin_client.get(
+            self.url, {"transaction_type": TransactionType.WITHDRAW, "page_size": 1}
         )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 0
+        assert response.data["results"] == []
 
     def test_unauthenticated_access(self, api_client):
-        url = reverse("user-transactions-list")
-        response = api_client.get(url)
+        response = api_client.get(self.url)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,6 +1,9 @@
+from datetime import date
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -114,9 +117,12 @@ class TestExpenseAPI:
         assert expense.cost == Decimal("75.00")
 
     def test_list_expenses_with_filters(self, admin_client, driver):
-
-        Expense.objects.create(description="Jan Expense", cost=10, date="2025-01-01")
-        Expense.objects.create(description="Feb Expense", cost=20, date="2025-02-01")
+        Expense.objects.bulk_create(
+            [
+                Expense(description="Jan Expense", cost=10, date="2025-01-01"),
+                Expense(description="Feb Expense", cost=20, date="2025-02-01"),
+            ]
+        )
         transaction = UserAccountTransaction.objects.create(
             user_account_id=driver.id,
             amount=Decimal("200.00"),
@@ -166,6 +172,30 @@ class TestExpenseAPI:
         )
         assert expenses[1]["description"] == "Feb Expense"
 
+    def test_list_expenses_query_count_does_not_grow(
+        self, admin_client, driver, django_capture_on_commit_callbacks
+    ):
+        def create_expense_transaction():
+            UserAccountTransaction.objects.create(
+                user_account_id=driver.id,
+                amount=Decimal("10.00"),
+                transaction_type=TransactionType.EXPENSE,
+                notes="Fuel",
+            )
+
+        create_expense_transaction()
+        with CaptureQueriesContext(connection) as one_expense:
+            admin_client.get(self.url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_expense_transaction()
+            create_expense_transaction()
+        with CaptureQueriesContext(connection) as three_expenses:
+            response = admin_client.get(self.url)
+
+        assert len(response.data["results"]["expenses"]) == 3
+        assert len(three_expenses) == len(one_expense)
+
     def test_delete_expense_standalone(self, admin_client):
         expense = Expense.objects.create(
             description="To be deleted", cost=10, date="2025-01-17"
@@ -174,3 +204,51 @@ class TestExpenseAPI:
         response = admin_client.delete(url)
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Expense.objects.filter(id=expense.id).exists()
+
+    def test_list_expenses_statistics_refresh_after_changes(
+        self, admin_client, django_capture_on_commit_callbacks
+    ):
+        expense = Expense.objects.create(
+            description="Rent", cost=Decimal("100.00"), date="2025-03-01"
+        )
+        response = admin_client.get(self.url)
+        assert response.data["results"]["statistics"]["total_expenses"] == Decimal(
+            "100.00"
+        )
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            Expense.objects.create(
+                description="Fuel", cost=Decimal("50.00"), date="2025-03-02"
+            )
+        # Until the write commits, readers keep getting the cached totals
+        response = admin_client.get(self.url)
+        assert response.data["results"]["statistics"]["total_expenses"] == Decimal(
+            "100.00"
+        )
+
+        for callback in callbacks:
+            callback()
+        response = admin_client.get(self.url)
+        assert response.data["results"]["statistics"]["total_expenses"] == Decimal(
+            "150.00"
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            expense.delete()
+        response = admin_client.get(self.url)
+        assert response.data["results"]["statistics"]["total_expenses"] == Decimal(
+            "50.00"
+        )
+
+    def test_list_expenses_statistics_month_labels(self, admin_client):
+        Expense.objects.create(
+            description="Rent",
+            cost=Decimal("100.00"),
+            date=date(date.today().year, 8, 1),
+        )
+
+        response = admin_client.get(self.url)
+
+        assert response.data["results"]["statistics"]["monthly"] == [
+            {"month": "اغسطس", "total": 100.0}
+        ]
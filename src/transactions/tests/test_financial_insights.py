@@ -0,0 +1,175 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from orders.models import Order, OrderStatus
+from transactions.models import Expense, TransactionType, UserAccountTransaction
+
+
+@pytest.fixture
+def financial_data(trader, driver):
+    delivered_order = Order.objects.create(
+        reference_code="REF-DELIVERED",
+        trader=trader,
+        status=OrderStatus.DELIVERED,
+    )
+    Order.objects.create(
+        reference_code="REF-CANCELLED",
+        trader=trader,
+        status=OrderStatus.CANCELLED,
+    )
+    Order.objects.create(
+        reference_code="REF-CREATED",
+        trader=trader,
+        status=OrderStatus.CREATED,
+    )
+
+    # Counted: trader withdraw and driver deposit linked to an order
+    UserAccountTransaction.objects.create(
+        user_account_id=trader.id,
+        amount=Decimal("50.00"),
+        transaction_type=TransactionType.WITHDRAW,
+        order=delivered_order,
+    )
+    UserAccountTransaction.objects.create(
+        user_account_id=driver.id,
+        amount=Decimal("20.00"),
+        transaction_type=TransactionType.DEPOSIT,
+        order=delivered_order,
+    )
+    # Ignored: rolled back, or not linked to an order
+    UserAccountTransaction.objects.create(
+        user_account_id=trader.id,
+        amount=Decimal("30.00"),
+        transaction_type=TransactionType.WITHDRAW,
+        order=delivered_order,
+        is_rolled_back=True,
+    )
+    UserAccountTransaction.objects.create(
+        user_account_id=trader.id,
+        amount=Decimal("40.00"),
+        transaction_type=TransactionType.WITHDRAW,
+    )
+
+    Expense.objects.create(description="Fuel", date=date.today(), cost=25)
+
+
+@pytest.mark.django_db
+class TestFinancialInsightsApiView:
+    def setup_method(self):
+        self.url = reverse("financial-insights")
+
+    def test_summary_totals(self, admin_client, financial_data):
+        response = admin_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_revenue"] == Decimal("50.00")
+        assert response.data["total_commissions"] == Decimal("20.00")
+        assert response.data["total_expenses"] == Decimal("25.00")
+        assert response.data["net_profit"] == Decimal("5.00")
+
+    def test_orders_statistics(self, admin_client, financial_data):
+        response = admin_client.get(self.url)
+
+        orders = response.data["orders"]
+        assert orders["delivered_order_count"] == 1
+        assert orders["cancelled_order_count"] == 1
+        assert orders["created__order_count"] == 1
+        assert orders["assigned_to_driver"] == 0
+        assert orders["in_progress_order_count"] == 0
+        assert orders["postponed_order_count"] == 0
+        assert orders["total_count"] == 3
+
+    def test_monthly_charts(self, admin_client, financial_data):
+        response = admin_client.get(self.url)
+
+        shipments = response.data["shipments_per_month"]
+        assert len(shipments) == 1
+        assert shipments[0]["shipment_count"] == 1
+
+        monthly = response.data["monthly_expenses_data"]
+        assert len(monthly) == 1
+        assert monthly[0]["name"] == shipments[0]["month"]
+        assert monthly[0]["total_income"] == 50.0
+        assert monthly[0]["total_commissions"] == 20.0
+        assert monthly[0]["total_delivery_expense"] == 25.0
+        assert monthly[0]["net_profit"] == 5.0
+
+    def test_monthly_chart_ignores_next_year(self, admin_client, financial_data):
+        today = date.today()
+        Expense.objects.create(
+            description="Prepaid rent",
+            date=today.replace(year=today.year + 1, day=1),
+            cost=100,
+        )
+
+        response = admin_client.get(self.url)
+
+        monthly = response.data["monthly_expenses_data"]
+        assert len(monthly) == 1
+        assert monthly[0]["total_delivery_expense"] == 25.0
+
+    def test_empty_range(self, admin_client, financial_data):
+        response = admin_client.get(
+            self.url, {"start_date": "2020-01-01", "end_date": "2020-01-31"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_revenue"] == 0
+        assert response.data["total_commissions"] == 0
+        assert response.data["total_expenses"] == 0
+        assert response.data["net_profit"] == 0
+
+    def test_range_excludes_day_after_end_date(self, admin_client):
+        Expense.objects.create(description="Fuel", date=date(2020, 1, 31), cost=10)
+        Expense.objects.create(description="Fuel", date=date(2020, 2, 1), cost=20)
+
+        response = admin_client.get(
+            self.url, {"start_date": "2020-01-01", "end_date": "2020-01-31"}
+        )
+
+        assert response.data["total_expenses"] == Decimal("10.00")
+
+    def test_start_date_after_end_date(self, admin_client):
+        response = admin_client.get(
+            self.url, {"start_date": "2025-02-01", "end_date": "2025-01-01"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cached_response_refreshes_after_changes(
+        self, admin_client, financial_data, trader, django_capture_on_commit_callbacks
+    ):
+        response = admin_client.get(self.url)
+        assert response.data["total_revenue"] == Decimal("50.00")
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            UserAccountTransaction.objects.create(
+                user_account_id=trader.id,
+                amount=Decimal("10.00"),
+                transaction_type=TransactionType.WITHDRAW,
+                order=Order.objects.get(reference_code="REF-CANCELLED"),
+            )
+            Expense.objects.create(description="Parking", date=date.today(), cost=5)
+        # Until the writes commit, readers keep getting the cached response
+        response = admin_client.get(self.url)
+        assert response.data["total_revenue"] == Decimal("50.00")
+
+        for callback in callbacks:
+            callback()
+        response = admin_client.get(self.url)
+        assert response.data["total_revenue"] == Decimal("60.00")
+        assert response.data["total_expenses"] == Decimal("30.00")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_financial_insights_outside_transaction(admin_client, financial_data):
+    response = admin_client.get(reverse("financial-insights"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["total_revenue"] == Decimal("50.00")
+    assert response.data["orders"]["total_count"] == 3
+    assert response.data["monthly_expenses_data"][0]["net_profit"] == 5.0
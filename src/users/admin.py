@@ -34,5 +34,7 @@ class DriverAdmin(admin.ModelAdmin):
 @admin.register(FirebaseDevice)
 class FirebaseDeviceAdmin(admin.ModelAdmin):
     list_display = ("user", "token", "last_seen", "created_at")
-    list_filter = ("user", "last_seen")
+    list_filter = (("user", admin.RelatedOnlyFieldListFilter), "last_seen")
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
     search_fields = ("user", "token")
@@ -26,6 +26,21 @@ class UserAccountViewSet(BaseViewSet):
     ordering_fields = ["email", "full_name", "phone_number", "role"]
     ordering = ["-id"]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.only(
+                "id",
+                "email",
+                "full_name",
+                "phone_number",
+                "role",
+                "is_active",
+                "created",
+                "modified",
+            )
+        return queryset
+
     def profile(self, request):
         serializer = self.get_serializer(request.user)
         return Response(serializer.data)
@@ -47,21 +62,12 @@ class FirebaseDeviceRegisterAPIView(APIView):
         serializer.is_valid(raise_exception=True)
 
         token = serializer.validated_data["token"]
-        user = request.user
-
-        device, created = FirebaseDevice.objects.get_or_create(
-            token=token,
-            defaults={"user": user},
-        )
-
-        if not created and device.user != user:
-            device.user = user
-            device.save(update_fields=["user", "last_seen"])
+        created = FirebaseDevice.objects.register(token, request.user)
 
         return Response(
             {
                 "created": created,
-                "token": device.token,
+                "token": token,
             },
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
@@ -0,0 +1,14 @@
+from utilities.cache import bump_cache_version, get_versioned_cache_key
+
+TRADER_LIST_CACHE_VERSION_KEY = "trader_list:version"
+TRADER_LIST_CACHE_TIMEOUT = 60 * 5
+
+
+def get_trader_list_cache_key(request):
+    return get_versioned_cache_key(
+        TRADER_LIST_CACHE_VERSION_KEY, "trader_list", request.build_absolute_uri()
+    )
+
+
+def invalidate_trader_list():
+    bump_cache_version(TRADER_LIST_CACHE_VERSION_KEY)
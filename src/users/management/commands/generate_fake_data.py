@@ -1,11 +1,14 @@
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
 from faker import Faker
 
-from users.models import Driver
+from users.models import Driver, UserAccount, UserRole
 
 fake = Faker()
 
+BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Generate fake data for testing"
@@ -27,24 +30,7 @@ class Command(BaseCommand):
             with transaction.atomic():
                 # Generate Drivers
                 self.stdout.write(f"Creating {num_drivers} drivers...")
-                for i in range(num_drivers):
-                    driver = Driver.objects.create(
-                        email=fake.email(),
-                        full_name=fake.name(),
-                        balance=fake.random_number(digits=5),
-                        phone_number=fake.numerify("010########"),
-                        vehicle_number=fake.bothify("???###"),  # Random vehicle number
-                        license_number=fake.bothify(
-                            "DL####????"
-                        ),  # Random license number
-                        is_active=True,
-                    )
-                    # Set a password for the driver
-                    driver.set_password("password123")
-                    driver.save()
-
-                    if (i + 1) % 50 == 0:
-                        self.stdout.write(f"Created {i + 1} drivers...")
+                self.create_drivers(num_drivers)
 
                 self.stdout.write(
                     self.style.SUCCESS(f"Successfully created {num_drivers} drivers")
@@ -53,3 +39,40 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error occurred: {str(e)}"))
             raise e
+
+    def create_drivers(self, num_drivers):
+        # Hashing is deliberately slow, every fake driver shares one password
+        password = make_password("password123")
+        accounts = UserAccount.objects.bulk_create(
+            [
+                UserAccount(
+                    email=fake.unique.email(),
+                    full_name=fake.name(),
+                    phone_number=fake.numerify("010########"),
+                    password=password,
+                    role=UserRole.DRIVER,
+                    is_active=True,
+                )
+                for _ in range(num_drivers)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        # bulk_create refuses multi-table inherited models, so the driver rows
+        # are inserted for the parent ids returned above
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Driver._meta.db_table}
+                    (useraccount_ptr_id, balance, vehicle_number, license_number)
+                SELECT * FROM unnest(
+                    %s::bigint[], %s::numeric[], %s::varchar[], %s::varchar[]
+                )
+                """,
+                [
+                    [account.id for account in accounts],
+                    [fake.random_number(digits=5) for _ in accounts],
+                    [fake.bothify("???###") for _ in accounts],
+                    [fake.bothify("DL####????") for _ in accounts],
+                ],
+            )
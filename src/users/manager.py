@@ -1,4 +1,5 @@
 from django.contrib.auth.models import UserManager
+from django.db import connections, models
 
 from utilities.exceptions import CustomValidationError
 
@@ -26,3 +27,22 @@ class UserAccountManager(UserManager):
             raise ValueError("Superuser must have is_superuser=True.")
 
         return self.create_user(email, password, **extra_fields)
+
+
+class FirebaseDeviceManager(models.Manager):
+
+    def register(self, token, user):
+        """Insert the token for ``user`` or move it to them; returns True if new."""
+        table = self.model._meta.db_table
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (token, user_id, last_seen, created_at)
+                VALUES (%s, %s, NOW(), NOW())
+                ON CONFLICT (token) DO UPDATE
+                SET user_id = EXCLUDED.user_id, last_seen = EXCLUDED.last_seen
+                RETURNING (xmax = 0)
+                """,
+                [token, user.pk],
+            )
+            return cursor.fetchone()[0]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-16 20:53
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so user account writes keep flowing
+    atomic = False
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0017_alter_useraccount_phone_number"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="trader",
+            index=models.Index(fields=["status"], name="trader_status_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="useraccount",
+            index=models.Index(fields=["role", "-id"], name="useraccount_role_id_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="useraccount",
+            index=models.Index(fields=["phone_number"], name="useraccount_phone_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="useraccount",
+            index=models.Index(fields=["full_name"], name="useraccount_full_name_idx"),
+        ),
+    ]
@@ -2,8 +2,9 @@ from decimal import Decimal
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import F
 
-from users.manager import UserAccountManager
+from users.manager import FirebaseDeviceManager, UserAccountManager
 from utilities.models.abstract_base_model import AbstractBaseModel
 
 
@@ -30,23 +31,27 @@ class UserAccount(AbstractUser, AbstractBaseModel):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Matches the default -id ordering of role-filtered lists
+            models.Index(fields=["role", "-id"], name="useraccount_role_id_idx"),
+            models.Index(fields=["phone_number"], name="useraccount_phone_idx"),
+            models.Index(fields=["full_name"], name="useraccount_full_name_idx"),
+        ]
+
     def __str__(self):
         return self.email
 
     def get_user_account_role(self):
-        if self.role == UserRole.DRIVER:
-            return Driver
-        elif self.role == UserRole.TRADER:
-            return Trader
-        return None
+        return ROLE_MODELS.get(self.role)
 
     def update_balance(self, amount):
-        if self.role == UserRole.DRIVER:
-            self.driver.balance += Decimal(amount)
-            self.driver.save()
-        if self.role == UserRole.TRADER:
-            self.trader.balance += Decimal(amount)
-            self.trader.save()
+        user_model = self.get_user_account_role()
+        if user_model is not None:
+            # Applied in SQL so concurrent transactions can't overwrite each other
+            user_model.objects.filter(pk=self.pk).update(
+                balance=F("balance") + Decimal(amount)
+            )
 
 
 class TraderStatus(models.TextChoices):
@@ -70,6 +75,9 @@ class Trader(UserAccount):
     class Meta:
         verbose_name = "Trader"
         verbose_name_plural = "Traders"
+        indexes = [
+            models.Index(fields=["status"], name="trader_status_idx"),
+        ]
 
 
 class Driver(UserAccount):
@@ -86,6 +94,13 @@ class Driver(UserAccount):
         verbose_name_plural = "Drivers"
 
 
+# Roles whose accounts carry a balance, mapped to the model that stores it
+ROLE_MODELS = {
+    UserRole.DRIVER: Driver,
+    UserRole.TRADER: Trader,
+}
+
+
 class FirebaseDevice(models.Model):
     user = models.ForeignKey(
         UserAccount,
@@ -102,6 +117,8 @@ class FirebaseDevice(models.Model):
     last_seen = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = FirebaseDeviceManager()
+
     class Meta:
         indexes = [
             models.Index(fields=["user", "token"]),
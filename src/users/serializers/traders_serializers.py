@@ -89,7 +89,9 @@ class RetrieveTraderSerializer(serializers.ModelSerializer):
     def get_prices(self, obj):
         from trader_pricing.serializers import TraderDeliveryZoneNestedSerializer
 
-        qs = obj.trader_delivery_zones_trader.order_by("-id")
+        qs = obj.trader_delivery_zones_trader.select_related("delivery_zone").order_by(
+            "-id"
+        )
         return TraderDeliveryZoneNestedSerializer(qs[:3], many=True).data
 
     def get_transactions(self, obj):
@@ -101,5 +103,5 @@ class RetrieveTraderSerializer(serializers.ModelSerializer):
     def get_orders(self, obj):
         from orders.serializers import OrderTraderSerializer
 
-        qs = obj.orders.order_by("-id")[:3]
+        qs = obj.orders.select_related("customer", "driver").order_by("-id")[:3]
         return OrderTraderSerializer(qs, many=True).data
@@ -1,8 +1,12 @@
-from django.db.models.signals import pre_delete
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
-from users.models import Driver, Trader
+from orders.models import Order
+from transactions.models import UserAccountTransaction
+from users.helpers import invalidate_trader_list
+from users.models import Driver, Trader, UserAccount, UserRole
 from utilities.exceptions import CustomValidationError
 
 
@@ -38,3 +42,35 @@ def prevent_driver_deletion_with_balance(sender, instance, **kwargs):
 def prevent_driver_deletion_with_transactions(sender, instance, **kwargs):
     if instance.transactions.exists():
         raise CustomValidationError(_("لا يمكن حذف السائق لأنه لديه عمليات مالية."))
+
+
+@receiver(post_save, sender=Trader)
+@receiver(post_delete, sender=Trader)
+@receiver(post_save, sender=UserAccount)
+@receiver(post_delete, sender=UserAccount)
+def invalidate_trader_list_on_account_change(
+    sender, instance, update_fields=None, **kwargs
+):
+    # Logins only touch last_login, which the trader list does not render
+    if instance.role != UserRole.TRADER or update_fields == {"last_login"}:
+        return
+    transaction.on_commit(invalidate_trader_list)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def invalidate_trader_list_on_order_count_change(
+    sender, instance, created=True, **kwargs
+):
+    # Status updates leave orders_count unchanged, only creates and deletes
+    # move it (post_delete sends no created flag)
+    if created:
+        transaction.on_commit(invalidate_trader_list)
+
+
+@receiver(post_save, sender=UserAccountTransaction)
+@receiver(post_delete, sender=UserAccountTransaction)
+def invalidate_trader_list_on_trader_transaction(sender, instance, **kwargs):
+    # Trader transactions move the rendered balance and total_sales
+    if instance.user_account_role == UserRole.TRADER:
+        transaction.on_commit(invalidate_trader_list)
@@ -4,6 +4,8 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 
+from orders.models import Order
+from transactions.models import TransactionType, UserAccountTransaction
 from users.models import Driver
 
 
@@ -17,6 +19,25 @@ class TestDriverViewSet:
         assert len(response.data["results"]) >= 1
         assert response.data["results"][0]["email"] == driver.email
 
+    def test_list_driver_annotations(self, admin_client, driver, trader):
+        """Test that sales and order_count are correctly annotated."""
+        order = Order.objects.create(
+            reference_code="REF-DRIVER", trader=trader, driver=driver
+        )
+        UserAccountTransaction.objects.create(
+            user_account=driver,
+            amount=Decimal("20.00"),
+            transaction_type=TransactionType.DEPOSIT,
+            order=order,
+        )
+
+        url = reverse("drivers-list")
+        response = admin_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["order_count"] == 1
+        assert Decimal(response.data["results"][0]["sales"]) == Decimal("20.00")
+
     def test_retrieve_driver(self, admin_client, driver):
         """Test retrieving a specific driver as admin."""
         url = reverse("drivers-detail", args=[driver.id])
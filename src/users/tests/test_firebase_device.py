@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -67,6 +69,22 @@ class TestFirebaseDeviceRegisterAPIView:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not FirebaseDevice.objects.filter(token=firebase_device.token).exists()
 
+    def test_unregister_device_deletes_without_fetching(
+        self, user_client, firebase_device
+    ):
+        """Test that unregistering issues a plain DELETE without loading devices first."""
+        payload = {"token": firebase_device.token}
+        with CaptureQueriesContext(connection) as queries:
+            user_client.delete(self.url, data=payload, format="json")
+
+        device_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "users_firebasedevice" in query["sql"]
+        ]
+        assert len(device_queries) == 1
+        assert device_queries[0].startswith("DELETE")
+
     def test_unregister_nonexistent_device(self, user_client):
         """Test unregistering a nonexistent token returns 204."""
         payload = {"token": "nonexistent-token"}
@@ -1,10 +1,14 @@
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
-from orders.models import Order
+from geo.models import DeliveryZone
+from orders.models import Customer, Order
+from trader_pricing.models import TraderDeliveryZone
 from transactions.models import TransactionType, UserAccountTransaction
 from users.models import Trader, UserRole
 
@@ -29,6 +33,38 @@ class TestTraderViewSet:
         assert Decimal(response.data["results"][0]["total_sales"]) == 0
         assert response.data["results"][0]["orders_count"] == 0
 
+    def test_list_traders_is_cached_until_data_changes(
+        self, admin_client, trader, driver, django_capture_on_commit_callbacks
+    ):
+        """Test that the trader list is served from cache and refreshed on writes."""
+        response = admin_client.get(self.list_url)
+        assert response.data["results"][0]["orders_count"] == 0
+
+        # Driver transactions do not change anything the trader list renders
+        with django_capture_on_commit_callbacks(execute=True):
+            UserAccountTransaction.objects.create(
+                user_account=driver,
+                amount=Decimal("10.00"),
+                transaction_type=TransactionType.DEPOSIT,
+            )
+        with CaptureQueriesContext(connection) as queries:
+            admin_client.get(self.list_url)
+        assert not any("users_trader" in query["sql"] for query in queries)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Order.objects.create(trader=trader)
+        response = admin_client.get(self.list_url)
+        assert response.data["results"][0]["orders_count"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserAccountTransaction.objects.create(
+                user_account=trader,
+                amount=Decimal("25.00"),
+                transaction_type=TransactionType.WITHDRAW,
+            )
+        response = admin_client.get(self.list_url)
+        assert Decimal(response.data["results"][0]["balance"]) == Decimal("25.00")
+
     def test_retrieve_trader(self, admin_client, trader):
         """Test that an admin can retrieve a specific trader."""
         url = reverse("traders-detail", kwargs={"pk": trader.pk})
@@ -90,6 +126,41 @@ class TestTraderViewSet:
         assert response.data["orders_count"] == 1
         assert Decimal(response.data["total_sales"]) == Decimal("50.00")
 
+    def test_retrieve_trader_query_count_does_not_grow(
+        self, user_client, trader, driver
+    ):
+        """Test that nested prices and orders are loaded with their relations."""
+
+        def create_related_rows(index):
+            zone = DeliveryZone.objects.create(name=f"Zone {index}", cost=10)
+            TraderDeliveryZone.objects.create(
+                trader=trader, delivery_zone=zone, price=Decimal("15.00")
+            )
+            customer = Customer.objects.create(
+                name=f"Customer {index}", address="Cairo", phone="01000000000"
+            )
+            Order.objects.create(
+                reference_code=f"REF-{index}",
+                trader=trader,
+                customer=customer,
+                driver=driver,
+            )
+
+        url = reverse("traders-detail", kwargs={"pk": trader.pk})
+        create_related_rows(1)
+        with CaptureQueriesContext(connection) as one_row:
+            user_client.get(url)
+
+        create_related_rows(2)
+        create_related_rows(3)
+        with CaptureQueriesContext(connection) as three_rows:
+            response = user_client.get(url)
+
+        assert len(response.data["prices"]) == 3
+        assert len(response.data["orders"]) == 3
+        assert response.data["orders"][0]["driver"]["id"] == driver.id
+        assert len(three_rows) == len(one_row)
+
     def test_trader_retrieve_date_filter(self, user_client, trader):
         """Test the retrieve action with date filter (smoke test)."""
         url = reverse("traders-detail", kwargs={"pk": trader.pk})
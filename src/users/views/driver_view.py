@@ -12,6 +12,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from notifications.service import send_notification
+from orders.models import Order
 from orders.permissions import IsDriverPermission
 from transactions.models import TransactionType, UserAccountTransaction
 from users.models import Driver
@@ -55,15 +56,32 @@ class DriverViewSet(BaseViewSet):
                 .annotate(total=Sum("amount"))
                 .values("total")
             )
+            order_count_subquery = (
+                Order.objects.filter(driver=OuterRef("pk"))
+                .values("driver")
+                .annotate(total=Count("id"))
+                .values("total")
+            )
 
             queryset = queryset.annotate(
                 total_delivery_cost=Subquery(total_delivery_cost_subquery),
                 order_count=Coalesce(
-                    Count("orders", distinct=True),
+                    Subquery(order_count_subquery, output_field=IntegerField()),
                     Value(0, output_field=IntegerField()),
                 ),
             )
 
+        if self.action == "list":
+            queryset = queryset.only(
+                "id",
+                "email",
+                "full_name",
+                "balance",
+                "vehicle_number",
+                "license_number",
+                "is_active",
+            )
+
         return queryset
 
     def get_serializer_class(self):
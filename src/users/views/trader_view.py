@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.db.models import (
     Count,
     DecimalField,
@@ -9,17 +10,21 @@ from django.db.models import (
 )
 from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
+from orders.models import Order
 from transactions.models import TransactionType, UserAccountTransaction
+from users.helpers import TRADER_LIST_CACHE_TIMEOUT, get_trader_list_cache_key
 from users.models import Trader
 from users.serializers.traders_serializers import (
     RetrieveTraderSerializer,
     TraderListSerializer,
     TraderSerializer,
 )
-from utilities.api import BaseViewSet
+from utilities.api import BaseViewSet, no_paginate_parameter
 
 
 class TraderViewSet(BaseViewSet):
@@ -47,6 +52,17 @@ class TraderViewSet(BaseViewSet):
     ]
     ordering = ["-id"]
 
+    @swagger_auto_schema(manual_parameters=[no_paginate_parameter])
+    def list(self, request, *args, **kwargs):
+        # Every caller sees the same traders, so pages are cached per URL and
+        # dropped whenever a trader, order or transaction changes
+        cache_key = get_trader_list_cache_key(request)
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, TRADER_LIST_CACHE_TIMEOUT)
+        return Response(data)
+
     def get_serializer_class(self):
         if self.action == "list":
             return TraderListSerializer
@@ -69,6 +85,12 @@ class TraderViewSet(BaseViewSet):
                 .annotate(total=Sum("amount"))
                 .values("total")
             )
+            orders_count_subquery = (
+                Order.objects.filter(trader=OuterRef("pk"))
+                .values("trader")
+                .annotate(total=Count("id"))
+                .values("total")
+            )
 
             queryset = Trader.objects.annotate(
                 total_sales=Coalesce(
@@ -76,9 +98,20 @@ class TraderViewSet(BaseViewSet):
                     Value(0, output_field=DecimalField()),
                 ),
                 orders_count=Coalesce(
-                    Count("orders", distinct=True),
+                    Subquery(orders_count_subquery, output_field=IntegerField()),
                     Value(0, output_field=IntegerField()),
                 ),
             )
+            if self.action == "list":
+                queryset = queryset.only(
+                    "id",
+                    "email",
+                    "full_name",
+                    "phone_number",
+                    "balance",
+                    "is_active",
+                    "created",
+                    "modified",
+                )
             return queryset
         return self.queryset
@@ -4,20 +4,18 @@ from rest_framework.viewsets import ModelViewSet
 
 from .mixins import InjectUserMixin
 
+no_paginate_parameter = openapi.Parameter(
+    "no_paginate",
+    openapi.IN_QUERY,
+    description="Set to true to disable pagination and return all results",
+    type=openapi.TYPE_BOOLEAN,
+    required=False,
+)
+
 
 class BaseViewSet(InjectUserMixin, ModelViewSet):
     pass
 
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                "no_paginate",
-                openapi.IN_QUERY,
-                description="Set to true to disable pagination and return all results",
-                type=openapi.TYPE_BOOLEAN,
-                required=False,
-            )
-        ]
-    )
+    @swagger_auto_schema(manual_parameters=[no_paginate_parameter])
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
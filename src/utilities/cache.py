@@ -0,0 +1,18 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+
+def get_versioned_cache_key(version_key, prefix, value):
+    # Entries are keyed by a version token so one write invalidates them all
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(version_key, version, None)
+    digest = hashlib.md5(value.encode()).hexdigest()
+    return f"{prefix}:{version}:{digest}"
+
+
+def bump_cache_version(version_key):
+    cache.set(version_key, uuid.uuid4().hex, None)
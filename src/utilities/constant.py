@@ -1 +1,36 @@
 DEFAULT_START_DATE = "2020-01-01"
+
+# Arabic month names indexed by month number, slot 0 is unused
+CONVERTED_MONTHLY = (
+    "",
+    "يناير",
+    "فبراير",
+    "مارس",
+    "أبريل",
+    "مايو",
+    "يونيو",
+    "يوليو",
+    "أغسطس",
+    "سبتمبر",
+    "أكتوبر",
+    "نوفمبر",
+    "ديسمبر",
+)
+
+# The expense statistics have always spelled April, August and October
+# without hamza, and clients match on these labels
+EXPENSE_CONVERTED_MONTHLY = (
+    "",
+    "يناير",
+    "فبراير",
+    "مارس",
+    "ابريل",
+    "مايو",
+    "يونيو",
+    "يوليو",
+    "اغسطس",
+    "سبتمبر",
+    "اكتوبر",
+    "نوفمبر",
+    "ديسمبر",
+)
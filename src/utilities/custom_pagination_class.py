@@ -1,3 +1,6 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
@@ -17,3 +20,42 @@ class CustomPageNumberPagination(PageNumberPagination):
         if self.request.query_params.get("no_paginate", "").lower() == "true":
             return Response({"results": data})
         return super().get_paginated_response(data)
+
+
+class EstimatedCountPaginator(Paginator):
+    """Use the planner's row estimate instead of COUNT(*) on large unfiltered tables."""
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        estimate = self.get_estimated_count()
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate
+        return super().count
+
+    def get_estimated_count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is None or query.where:
+            return None
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        # to_regclass resolves the table through search_path, so a same-named
+        # relation in another schema can't be picked up
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [connection.ops.quote_name(self.object_list.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        if row is None or row[0] < 0:
+            return None
+        return row[0]
+
+
+class EstimatedCountPageNumberPagination(CustomPageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
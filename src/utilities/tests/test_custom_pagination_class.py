@@ -0,0 +1,55 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from transactions.models import Expense
+from utilities.custom_pagination_class import EstimatedCountPaginator
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    @pytest.fixture(autouse=True)
+    def expenses(self):
+        Expense.objects.bulk_create(
+            Expense(description=f"Expense {index}", cost=10, date="2025-01-01")
+            for index in range(5)
+        )
+        # Fill in pg_class.reltuples, the estimate the paginator reads
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE transactions_expense")
+
+    def test_unfiltered_count_uses_estimate(self, monkeypatch):
+        monkeypatch.setattr(EstimatedCountPaginator, "estimate_threshold", 1)
+        paginator = EstimatedCountPaginator(Expense.objects.order_by("id"), 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = paginator.count
+
+        assert count == 5
+        assert len(queries) == 1
+        assert "reltuples" in queries[0]["sql"]
+
+    def test_filtered_count_is_exact(self, monkeypatch):
+        monkeypatch.setattr(EstimatedCountPaginator, "estimate_threshold", 1)
+        Expense.objects.filter(description="Expense 0").update(cost=0)
+        paginator = EstimatedCountPaginator(
+            Expense.objects.filter(cost__gt=0).order_by("id"), 2
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            count = paginator.count
+
+        assert count == 4
+        assert len(queries) == 1
+        assert "reltuples" not in queries[0]["sql"]
+        assert "COUNT" in queries[0]["sql"]
+
+    def test_count_below_threshold_is_exact(self):
+        paginator = EstimatedCountPaginator(Expense.objects.order_by("id"), 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = paginator.count
+
+        assert count == 5
+        assert "reltuples" in queries[0]["sql"]
+        assert "COUNT" in queries[-1]["sql"]